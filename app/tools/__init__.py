@@ -0,0 +1,22 @@
+import importlib
+import pkgutil
+
+from core.tools import Toolkit
+
+try:
+    from app.tools._registry_generated import REGISTRY
+except ImportError:  # not generated yet, or blocked by scripts/gen_registry.py
+    REGISTRY = {}
+
+# Seed before any tool module is imported so its decorators find the entries already built
+Toolkit.seed(REGISTRY)
+
+for _module in pkgutil.iter_modules(__path__):
+    if not _module.name.startswith("_"):
+        importlib.import_module(f"{__name__}.{_module.name}")
+
+# Drop generated entries whose tool or function is gone from source
+Toolkit.prune()
+
+# Every app tool is loaded: move them into the shared read-only builtin layer
+Toolkit.freeze()
@@ -0,0 +1,15 @@
+# Generated by scripts/gen_registry.py -- do not edit by hand.
+
+REGISTRY = {'SerpApiTool': {'category': 'Search',
+                 'description': 'Tools for interacting with SerpApi',
+                 'fingerprint': '46e8a20488b31118c0452c66a7c7403e5088f69bacc0b250bc49e305908d229c',
+                 'functions': {},
+                 'icon': 'serpapi',
+                 'id': 'SerpApiTool',
+                 'schema': {'properties': {'api_key': {'description': 'SerpApi API key',
+                                                       'title': 'Api Key',
+                                                       'type': 'string'}},
+                            'required': ['api_key'],
+                            'title': 'SerpApiConfig',
+                            'type': 'object'},
+                 'title': 'SerpApi Tools'}}
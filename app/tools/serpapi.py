@@ -1,4 +1,12 @@
+import asyncio
 import json
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
 from pydantic import BaseModel, Field
 
 from app.utils.package import install_package
@@ -7,6 +15,49 @@ from core.tools.category import ToolCategory
 from core.tools.toolkit import tool, tool_func
 
 
+SERPAPI_SEARCH_URL = "https://serpapi.com/search"
+SERPAPI_TIMEOUT = 60
+SERPAPI_MAX_CONNECTIONS = 10
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_TTL = 300  # seconds
+
+# Name of the query parameter for each SerpApi engine
+_QUERY_PARAM = {"google": "q", "youtube": "search_query"}
+
+# Response fields each engine's results are built from; everything else is dropped before caching
+_RESULT_KEYS = {
+    "google": ("organic_results", "recipes_results", "shopping_results", "knowledge_graph", "related_questions"),
+    "youtube": ("video_results", "movie_results", "channel_results"),
+}
+
+
+def _pick_results(engine: str, body: bytes) -> dict[str, Any]:
+    results = orjson.loads(body)
+    return {key: results[key] for key in _RESULT_KEYS[engine] if key in results}
+
+
+def _google_results(results: dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            "search_results": results.get("organic_results", ""),
+            "recipes_results": results.get("recipes_results", ""),
+            "shopping_results": results.get("shopping_results", ""),
+            "knowledge_graph": results.get("knowledge_graph", ""),
+            "related_questions": results.get("related_questions", ""),
+        }
+    )
+
+
+def _youtube_results(results: dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            "video_results": results.get("video_results", ""),
+            "movie_results": results.get("movie_results", ""),
+            "channel_results": results.get("channel_results", ""),
+        }
+    )
+
+
 class SerpApiConfig(BaseModel):
     api_key: str = Field(..., description="SerpApi API key")
 
@@ -23,19 +74,140 @@ class SearchConfig(BaseModel):
     category=ToolCategory.Search,
 )
 class SerpApiTool(Toolkit):
+    # __dict__ lets @cachedmethod bind its wrapper once per instance instead of on every call
+    __slots__ = ("_session", "_aclient", "_aclient_loop", "_search_cache", "_search_lock", "__dict__")
+
+    def __init__(self, configuration: dict[str, Any]):
+        super().__init__(configuration)
+        # Shared HTTP session, created on first search so every query reuses its connection pool
+        self._session = None
+        # Async counterpart for the *_async search methods, also created on first use
+        self._aclient = None
+        # Event loop the async client was created on; its connections cannot be used from another loop
+        self._aclient_loop = None
+        # Recent results per (engine, query, num), shared by all search methods
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        # Guards the cache, which is not thread-safe; held only around lookups and stores
+        self._search_lock = threading.Lock()
+
     @property
     def api_key(self) -> str:
         return self.configuration.get("api_key", "")
 
+    def _get_session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=SERPAPI_MAX_CONNECTIONS, pool_maxsize=SERPAPI_MAX_CONNECTIONS)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _get_aclient(self):
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            import httpx
+
+            # A client left from an earlier loop (e.g. a previous asyncio.run) is dropped, not reused
+            self._aclient = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=SERPAPI_MAX_CONNECTIONS),
+                timeout=SERPAPI_TIMEOUT,
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def aclose(self):
+        """Close the async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+        # Event loop the async client was created on; its connections cannot be used from another loop
+        self._aclient_loop = None
+
+    def _params(self, engine: str, query: str, num: int | None) -> dict[str, Any]:
+        params = {"engine": engine, _QUERY_PARAM[engine]: query, "num": num, "api_key": self.api_key}
+        params.update(output="json", source="python")
+        # Like the serpapi client, leave unset options out of the query string
+        return {key: value for key, value in params.items() if value is not None}
+
+    def _search(self, engine: str, query: str, num: int | None) -> dict[str, Any]:
+        """Run a SerpApi query over the shared session and return the fields used for `engine`."""
+        params = self._params(engine, query, num)
+        response = self._get_session().get(SERPAPI_SEARCH_URL, params=params, timeout=SERPAPI_TIMEOUT)
+        # Raise on 4xx/5xx so failures surface as errors and never reach the response cache
+        response.raise_for_status()
+        return _pick_results(engine, response.content)
+
+    async def _asearch(self, engine: str, query: str, num: int | None) -> dict[str, Any]:
+        """Async `_search` over the shared httpx client."""
+        response = await self._get_aclient().get(SERPAPI_SEARCH_URL, params=self._params(engine, query, num))
+        response.raise_for_status()
+        return _pick_results(engine, response.content)
+
+    @cachedmethod(lambda self: self._search_cache, lock=lambda self: self._search_lock)
+    def _do_search(self, engine: str, query: str, num: int | None) -> dict[str, Any]:
+        """Search `engine` for `query`, reusing a cached response for repeats within the TTL."""
+        return self._search(engine, query, num)
+
+    async def _ado_search(self, engine: str, query: str, num: int | None) -> dict[str, Any]:
+        """Async `_do_search`; both share the same response cache."""
+        key = hashkey(engine, query, num)
+        with self._search_lock:
+            results = self._search_cache.get(key)
+        if results is None:
+            # Not held across the request, which would block other threads on the network
+            results = await self._asearch(engine, query, num)
+            with self._search_lock:
+                self._search_cache[key] = results
+        return results
+
+    def _error(self, e: Exception) -> dict[str, str]:
+        """Error result for a failed search, with the API key redacted from any URL in the message."""
+        message = str(e)
+        if self.api_key:
+            message = message.replace(self.api_key, "***")
+        return {"error": message}
+
+    def _run(self, package: str, search: Callable[[], str]) -> str | dict[str, str]:
+        """Run `search`; on ImportError install `package` and retry it once, then give up."""
+        for attempt in range(2):
+            try:
+                return search()
+            except ImportError as e:
+                if attempt or not install_package(package, module=package):
+                    return self._error(e)
+            except Exception as e:
+                return self._error(e)
+
+    async def _arun(self, package: str, search: Callable[[], Awaitable[str]]) -> str | dict[str, str]:
+        """Async `_run`."""
+        for attempt in range(2):
+            try:
+                return await search()
+            except ImportError as e:
+                if attempt or not install_package(package, module=package):
+                    return self._error(e)
+            except Exception as e:
+                return self._error(e)
+
     # @tool_func(SearchConfig, title="Search Google")
     def search_google(self, query: str, _config: dict):
         """
         search_google(query, _config)
 
         Performs a Google search query using the provided configuration and returns
-        the organic search results. The function utilizes the SerpAPI library to
-        execute the search. If the library is not installed, it will attempt to
-        install it and retry the search. Any errors during execution are logged and
+        the organic search results. The query is sent to the SerpApi endpoint over
+        the tool's shared HTTP session. If the HTTP client is not installed, it will
+        attempt to install it and retry the search. Any errors during execution are logged and
         returned in the response.
 
         Args:
@@ -47,38 +219,17 @@ class SerpApiTool(Toolkit):
             list: A list of dictionaries containing the organic search results.
                   Returns a dictionary with an "error" key in case of exceptions.
         """
-        try:
-            from serpapi import GoogleSearch
-            params = {"q": query, "api_key": self.api_key, "num": 2}
-
-            search = GoogleSearch(params)
-            results = search.get_dict()
-
-            filtered_results = {
-                "search_results": results.get("organic_results", ""),
-                "recipes_results": results.get("recipes_results", ""),
-                "shopping_results": results.get("shopping_results", ""),
-                "knowledge_graph": results.get("knowledge_graph", ""),
-                "related_questions": results.get("related_questions", ""),
-            }
-
-            return json.dumps(filtered_results)
-
-        except ImportError:
-            install_package("google-search-results")
-            self.search_google(query, _config)
-        except Exception as e:
-            return {"error": str(e)}
+        return self._run("requests", lambda: _google_results(self._do_search("google", query, 2)))
 
     # @tool_func(SearchConfig, title="Search YouTube")
     def search_youtube(self, query: str, _config: dict):
         """
         Search for YouTube videos based on a query and configuration.
 
-        This method uses the YoutubeSearch tool from the SerpAPI library to fetch video
-        results from YouTube. The `num_results` is determined from the configuration
-        provided. If the SerpAPI library is missing, the script attempts to install it
-        and retries the search. Any exceptions that occur during the execution are
+        This method queries the SerpApi YouTube engine over the tool's shared HTTP
+        session. The `num_results` is determined from the configuration provided.
+        If the HTTP client is missing, the script attempts to install it and
+        retries the search. Any exceptions that occur during the execution are
         logged, and an error response is returned.
 
         Args:
@@ -93,23 +244,46 @@ class SerpApiTool(Toolkit):
                 Returns a list of video result dictionaries if successful. If an
                 exception occurs, a dictionary containing an error message is returned.
         """
-        try:
-            from serpapi import YoutubeSearch
-            params = {"search_query": query, "num": _config.get("num_results"), "api_key": self.api_key}
-
-            search = YoutubeSearch(params)
-            results = search.get_dict()
-
-            filtered_results = {
-                "video_results": results.get("video_results", ""),
-                "movie_results": results.get("movie_results", ""),
-                "channel_results": results.get("channel_results", ""),
-            }
-
-            return json.dumps(filtered_results)
-
-        except ImportError:
-            install_package("google-search-results")
-            self.search_youtube(query, _config)
-        except Exception as e:
-            return {"error": str(e)}
+        num = _config.get("num_results")
+        return self._run("requests", lambda: _youtube_results(self._do_search("youtube", query, num)))
+
+    async def search_google_async(self, query: str, _config: dict):
+        """
+        Async variant of `search_google`.
+
+        Runs over a shared httpx.AsyncClient so it can be awaited together with
+        other searches, e.g. `asyncio.gather(tool.search_google_async(...),
+        tool.search_youtube_async(...))`. Use the tool as an async context manager,
+        or call `aclose()` when done with it.
+
+        Args:
+            query (str): The search query string.
+            _config (dict): Configuration dictionary containing parameters for the
+                search such as the number of results.
+
+        Returns:
+            str | dict: The filtered results as JSON, or a dictionary with an "error" key.
+        """
+        async def search():
+            return _google_results(await self._ado_search("google", query, 2))
+
+        return await self._arun("httpx", search)
+
+    async def search_youtube_async(self, query: str, _config: dict):
+        """
+        Async variant of `search_youtube`, see `search_google_async`.
+
+        Args:
+            query (str): The search query to use for fetching YouTube results.
+            _config (dict): Configuration dictionary that may include the number
+                of results to fetch.
+
+        Returns:
+            str | dict: The filtered results as JSON, or a dictionary with an "error" key.
+        """
+        num = _config.get("num_results")
+
+        async def search():
+            return _youtube_results(await self._ado_search("youtube", query, num))
+
+        return await self._arun("httpx", search)
@@ -1,17 +1,44 @@
+import importlib.util
+from collections.abc import Iterable
+
+# Packages installed (or found already importable) during this process
+_INSTALLED: set[str] = set()
+
+
+def install_packages(packages: Iterable[str], modules: dict[str, str] | None = None) -> bool:
+    """Install all missing packages with a single `poetry add` run.
+
+    `modules` optionally maps a package to the module it provides; packages whose
+    module is already importable are skipped.
+    """
+    modules = modules or {}
+    missing = []
+    for package in dict.fromkeys(packages):
+        if package in _INSTALLED:
+            continue
+        module = modules.get(package)
+        if module is not None and importlib.util.find_spec(module) is not None:
+            _INSTALLED.add(package)
+            continue
+        missing.append(package)
+    if not missing:
+        return True
 
-def install_package(package: str) -> bool:
     _flag = False
     import subprocess
 
     try:
-        result = subprocess.run(
-            ["poetry", "add", package, "--group", "dev"], check=True, capture_output=True, text=True
-        )
-        print(result.stdout)
-        print(result.stderr)
+        # Output streams straight to the parent's stdout/stderr
+        subprocess.run(["poetry", "add", *missing, "--group", "dev"], check=True)
+        importlib.invalidate_caches()
+        _INSTALLED.update(missing)
         _flag = True
     except Exception as e:
-        print(f"Error occurred while installing package '{package}': {e!s}")
+        print(f"Error occurred while installing packages {', '.join(missing)}: {e!s}")
     finally:
         print("------------------------------------------------------------------------")
     return _flag
+
+
+def install_package(package: str, module: str | None = None) -> bool:
+    return install_packages([package], {package: module} if module else None)
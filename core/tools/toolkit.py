@@ -1,38 +1,239 @@
+import copy
+import hashlib
 import inspect
+import sys
+from collections import ChainMap
 from collections.abc import Callable
-from functools import wraps
+from dataclasses import dataclass, field
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, ClassVar, TypeVar
 
-from docstring_parser import parse
 from pydantic import BaseModel
 
 # Type variables for better type hints
 T = TypeVar("T", bound="Toolkit")
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Marker for a parameter without a default or annotation
+_EMPTY = inspect.Parameter.empty
+
+# Shared read-only fallback for a missing "functions" configuration section
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+# Python type name -> JSON schema type
+_PY_TO_JSON: dict[str, str] = {
+    "int": "number",
+    "float": "number",
+    "complex": "number",
+    "Decimal": "number",
+    "str": "string",
+    "string": "string",
+    "bool": "boolean",
+    "boolean": "boolean",
+    "NoneType": "null",
+    "None": "null",
+    "list": "array",
+    "tuple": "array",
+    "set": "array",
+    "frozenset": "array",
+    "dict": "object",
+    "mapping": "object",
+}
+
+
+# Section headers that open the argument list of a Google-style docstring
+_ARGS_HEADERS = ("Args:", "Arguments:")
+
+
+def _parse_args_block(doc: str) -> dict[str, str]:
+    """
+    Get the argument descriptions from the "Args:" section of a Google-style docstring.
+    :param doc: The cleaned docstring, as returned by `inspect.getdoc`.
+    :return: A mapping of argument name to description.
+    """
+    descriptions: dict[str, str] = {}
+    lines = iter(doc.splitlines())
+    for line in lines:
+        if line.strip() in _ARGS_HEADERS:
+            header_indent = len(line) - len(line.lstrip())
+            break
+    else:
+        return descriptions
+
+    arg_indent = None
+    name = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent <= header_indent:
+            # Dedented back to the header level: the next section starts
+            break
+        if arg_indent is None:
+            arg_indent = indent
+        if indent <= arg_indent:
+            # "name (type): description" or "name: description"
+            head, sep, desc = stripped.partition(":")
+            name = head.partition("(")[0].strip() if sep else None
+            if name:
+                descriptions[name] = desc.strip()
+        elif name:
+            # Continuation of the previous argument's description
+            descriptions[name] = f"{descriptions[name]} {stripped}".lstrip()
+    return descriptions
+
 
 def _get_json_type_for_py_type(arg: str) -> str:
     """
     Get the JSON schema type for a given type.
     :param arg: The type to get the JSON schema type for.
-    :return: The JSON schema type.
-    """
-    # App.logger.info(f"Getting JSON type for: {arg}")
-    if arg in ("int", "float", "complex", "Decimal"):
-        return "number"
-    if arg in ("str", "string"):
-        return "string"
-    if arg in ("bool", "boolean"):
-        return "boolean"
-    if arg in ("NoneType", "None"):
-        return "null"
-    if arg in ("list", "tuple", "set", "frozenset"):
-        return "array"
-    if arg in ("dict", "mapping"):
-        return "object"
-
-    # If the type is not recognized, return "object"
-    return "unknown"
+    :return: The JSON schema type, or "unknown" if the type is not recognized.
+    """
+    return _PY_TO_JSON.get(arg, "unknown")
+
+
+@lru_cache(maxsize=None)
+def _json_schema_for(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Build the JSON schema for a pydantic model once and reuse it.
+    :param model: The pydantic model class.
+    :return: The cached JSON schema. Callers must not mutate it; use `_schema_copy`.
+    """
+    return model.model_json_schema()
+
+
+def _schema_copy(model: type[BaseModel] | None) -> dict[str, Any] | None:
+    """
+    Get a private copy of the cached JSON schema for a model.
+    :param model: The pydantic model class, or None.
+    :return: A deep copy of the schema, or None when no model is given.
+    """
+    return copy.deepcopy(_json_schema_for(model)) if model else None
+
+
+SchemaFactory = Callable[[], dict[str, Any] | None]
+
+
+class _LazySchema:
+    """
+    Mixin for registry records whose JSON schema is built on first access.
+    Records keep only a `schema_factory` resident until `schema` is read.
+    """
+
+    __slots__ = ()
+
+    @property
+    def schema(self) -> dict[str, Any] | None:
+        if self._schema is None and self.schema_factory is not None:
+            self._schema = self.schema_factory()
+            self.schema_factory = None
+        return self._schema
+
+
+@dataclass(slots=True)
+class ToolFuncRecord(_LazySchema):
+    """Registry entry for a function registered with `tool_func`."""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    parameters: list[dict[str, Any]] = field(default_factory=list)
+    returns: dict[str, Any] = field(default_factory=lambda: {"type": ",", "description": ""})
+    schema_factory: SchemaFactory | None = field(default=None, repr=False, compare=False)
+    enabled: bool = True
+    llm_tool: dict[str, Any] = field(default_factory=dict)
+    fingerprint: str | None = field(default=None, repr=False, compare=False)
+    seeded: bool = field(default=False, init=False, repr=False, compare=False)
+    _schema: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def summary(self) -> dict[str, Any]:
+        """Compact view of the function without its schema."""
+        return {"id": self.id, "title": self.title, "description": self.description}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict view of the function with its schema materialized."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "parameters": self.parameters,
+            "returns": self.returns,
+            "schema": self.schema,
+            "enabled": self.enabled,
+            "llm_tool": self.llm_tool,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolFuncRecord":
+        """Rebuild a record from `to_dict` output, keeping the stored schema."""
+        record = cls(**{key: value for key, value in data.items() if key != "schema"})
+        record._schema = data.get("schema")
+        record.seeded = True
+        return record
+
+
+@dataclass(slots=True)
+class ToolRecord(_LazySchema):
+    """Registry entry for a class registered with `tool`."""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    icon: str | None = None
+    category: str | None = None
+    functions: dict[str, ToolFuncRecord | dict[str, Any]] = field(default_factory=dict)
+    schema_factory: SchemaFactory | None = field(default=None, repr=False, compare=False)
+    fingerprint: str | None = field(default=None, repr=False, compare=False)
+    seeded: bool = field(default=False, init=False, repr=False, compare=False)
+    _schema: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def summary(self) -> dict[str, Any]:
+        """Compact view of the tool and its functions without any schema."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "functions": [_summary_of(f) for f in self.functions.values()],
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict view of the tool with every schema materialized."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "icon": self.icon,
+            "category": self.category,
+            "functions": {
+                name: f.to_dict() if isinstance(f, ToolFuncRecord) else f for name, f in self.functions.items()
+            },
+            "schema": self.schema,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolRecord":
+        """Rebuild a record from `to_dict` output, keeping the stored schemas."""
+        fields = {key: value for key, value in data.items() if key not in ("schema", "functions")}
+        functions = {name: ToolFuncRecord.from_dict(f) for name, f in data.get("functions", {}).items()}
+        record = cls(functions=functions, **fields)
+        record._schema = data.get("schema")
+        record.seeded = True
+        return record
+
+
+# Records built by `tool_func` for a class whose `tool` decorator has not run yet, keyed by
+# (module, class name); class bodies run their method decorators before the class decorator
+_PENDING_FUNCTIONS: dict[tuple[str, str], dict[str, ToolFuncRecord]] = {}
+
+# Tools moved here by `Toolkit.freeze()`; exposed to Toolkit only through a read-only view
+_BUILTIN_TOOLS: dict[str, ToolRecord | dict[str, Any]] = {}
 
 
 class Toolkit:
@@ -46,11 +247,15 @@ class Toolkit:
     structured and organized storage.
 
     Attributes:
-        __tools (ClassVar[dict[str, dict[str, Any]]]): A dictionary containing
-            all globally registered tools and their associated configurations.
+        _tools (ClassVar[ChainMap[str, ToolRecord | dict[str, Any]]]): All globally
+            registered tools and their associated configurations. New registrations go
+            to the first ("user") layer; `freeze()` moves them into the read-only
+            builtin layer behind it.
     """
 
-    __tools: ClassVar[dict[str, dict[str, Any]]] = {}
+    __slots__ = ("configuration",)
+
+    _tools: ClassVar[ChainMap[str, ToolRecord | dict[str, Any]]] = ChainMap({}, MappingProxyType(_BUILTIN_TOOLS))
 
     def __init__(self, configuration: dict[str, Any]):
         self.configuration: dict[str, Any] = (
@@ -61,22 +266,120 @@ class Toolkit:
     def tool(cls, _cls: str, _func: str = None):
         """Get the tool class name"""
         if _func is None:
-            return cls.__tools[_cls]
-        return cls.__tools[_cls]["functions"][_func]
+            return cls._tools[_cls]
+        return _functions_of(cls._tools[_cls])[_func]
+
+    @classmethod
+    def summaries(cls) -> list[dict[str, Any]]:
+        """Get the compact id/title/description/category view of every registered tool"""
+        return [_summary_of(record) for record in cls._tools.values()]
+
+    @classmethod
+    def lookup(cls, name: str, tool_cls: str = None) -> ToolRecord | ToolFuncRecord | dict | None:
+        """Get a registered tool, or a function of a tool, or None if it is not registered"""
+        if tool_cls is None:
+            return cls._tools.get(name)
+        record = cls._tools.get(tool_cls)
+        return None if record is None else _functions_of(record).get(name)
+
+    @classmethod
+    def is_registered(cls, name: str, tool_cls: str = None) -> bool:
+        """Check whether a tool, or a function of a tool, is already registered"""
+        if tool_cls is None:
+            return name in cls._tools
+        record = cls._tools.get(tool_cls)
+        return record is not None and name in _functions_of(record)
+
+    @classmethod
+    def seed(cls, registry: dict[str, dict[str, Any]]):
+        """Pre-populate the registry from `ToolRecord.to_dict` output, e.g. a generated registry module"""
+        for name, data in registry.items():
+            if name not in cls._tools:
+                cls._tools[name] = ToolRecord.from_dict(data)
+
+    @classmethod
+    def prune(cls):
+        """Drop seeded tools and functions that no decorator confirmed, e.g. removed from source since generation"""
+        user = cls._tools.maps[0]
+        for name, record in list(user.items()):
+            if not isinstance(record, ToolRecord):
+                continue
+            if record.seeded:
+                del user[name]
+            else:
+                record.functions = {
+                    key: f for key, f in record.functions.items() if not getattr(f, "seeded", False)
+                }
 
     @classmethod
-    def register(cls, name: str, kwargs: dict, tool_cls: str = None):
+    def freeze(cls):
+        """Move every registered tool into the read-only builtin layer, e.g. once all app tools are imported"""
+        user = cls._tools.maps[0]
+        _BUILTIN_TOOLS.update(user)
+        user.clear()
+
+    @classmethod
+    def register(cls, name: str, kwargs: ToolRecord | ToolFuncRecord | dict, tool_cls: str = None):
         """Register a tool with its configuration"""
+        tools = cls._tools
         if tool_cls is not None:
-            if tool_cls not in cls.__tools:
+            record = tools.get(tool_cls)
+            if record is None:
                 raise ValueError(f"Tool {tool_cls} is not registered")
+            if tool_cls not in tools.maps[0]:
+                raise ValueError(f"Tool {tool_cls} is frozen")
 
-            d = cls.__tools[tool_cls]
-            if name in d["functions"]:
+            functions = _functions_of(record)
+            if name in functions:
                 raise ValueError(f"Tool {name} is already registered in {tool_cls}")
-            d["functions"][name] = kwargs
+            functions[name] = kwargs
         else:
-            cls.__tools[name] = kwargs
+            tools[name] = kwargs
+
+
+def _functions_of(record: ToolRecord | dict[str, Any]) -> dict[str, Any]:
+    """Get the registered functions of a tool entry, record or plain dict."""
+    return record.functions if isinstance(record, ToolRecord) else record["functions"]
+
+
+def _summary_of(record: ToolRecord | ToolFuncRecord | dict[str, Any]) -> dict[str, Any]:
+    """Get the summary of a registry entry, record or plain dict."""
+    if isinstance(record, (ToolRecord, ToolFuncRecord)):
+        return record.summary()
+    summary = {key: record.get(key) for key in ("id", "title", "description", "category") if key in record}
+    if "functions" in record:
+        summary["functions"] = [_summary_of(f) for f in record["functions"].values()]
+    return summary
+
+
+@lru_cache(maxsize=None)
+def _module_fingerprint(module_name: str) -> str | None:
+    """
+    Hash the source file of the module a tool is declared in, once per module.
+    Any edit to the module (titles, docstrings, signatures, models declared there)
+    changes it without any introspection of the tool itself.
+    :param module_name: The `__module__` of the decorated class or function.
+    :return: A hex digest of the source file, or None when the module has no readable file.
+    """
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if path is None:
+        return None
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _is_current(entry: ToolRecord | ToolFuncRecord | dict | None, fingerprint: str | None) -> bool:
+    """Check whether a registry entry was built from the module source with the given fingerprint."""
+    if fingerprint is None or not isinstance(entry, (ToolRecord, ToolFuncRecord)):
+        return False
+    return entry.fingerprint == fingerprint
+
+
+def _schema_factory(schema: type[BaseModel] | None) -> SchemaFactory | None:
+    """Defer building the JSON schema of a model until it is first needed."""
+    return partial(_schema_copy, schema) if schema else None
 
 
 def tool(
@@ -108,15 +411,25 @@ def tool(
     """
 
     def decorator(cls: type[T]) -> type[T]:
-        kwargs = {
-            "id": cls.__name__,
-            "title": title,
-            "description": description or cls.__doc__,
-            "icon": icon,
-            "category": category,
-            "functions": {},
-            "schema": schema.model_json_schema() if schema else None,
-        }
+        functions = _PENDING_FUNCTIONS.pop((cls.__module__, cls.__name__), {})
+        fingerprint = _module_fingerprint(cls.__module__)
+        existing = Toolkit.lookup(cls.__name__)
+        if _is_current(existing, fingerprint):
+            # Already seeded from the generated registry and unchanged in source; keep only the
+            # functions still decorated in source
+            existing.seeded = False
+            existing.functions = functions
+            return cls
+        kwargs = ToolRecord(
+            id=cls.__name__,
+            title=title,
+            description=description or cls.__doc__,
+            icon=icon,
+            category=category,
+            schema_factory=_schema_factory(schema),
+            functions=functions,
+            fingerprint=fingerprint,
+        )
         Toolkit.register(cls.__name__, kwargs)
         return cls
 
@@ -149,42 +462,52 @@ def tool_func(schema: type[BaseModel] | None = None, title: str = None, desc: st
     """
 
     def decorator(func: F) -> F:
-        parsed = parse(inspect.getdoc(func))
-        sig = inspect.signature(func)
-        args = []
-        for name, param in sig.parameters.items():
-            if name == "self" or name == "_config":
-                continue
-            args.append(
+        tool_cls, dot, _ = func.__qualname__.partition(".")
+        if not dot:
+            raise ValueError(f"Tool {func.__name__} must be a method of a @tool class")
+        fingerprint = _module_fingerprint(func.__module__)
+        record = Toolkit.lookup(func.__name__, tool_cls=tool_cls)
+        # Functions seeded from the generated registry skip introspection unless their module changed
+        if not _is_current(record, fingerprint):
+            param_descriptions = _parse_args_block(inspect.getdoc(func) or "")
+            sig = inspect.signature(func)
+            args = [
                 {
                     "name": name,
-                    "description": next((p.description for p in parsed.params if p.arg_name == name), ""),
-                    "optional": param.default is not inspect.Parameter.empty,
-                    "default": param.default if param.default is not inspect.Parameter.empty else None,
+                    "description": param_descriptions.get(name, ""),
+                    "optional": param.default is not _EMPTY,
+                    "default": param.default if param.default is not _EMPTY else None,
                     "type": _get_json_type_for_py_type(
-                        param.annotation.__name__ if param.annotation is not inspect.Parameter.empty else "any"
+                        param.annotation.__name__ if param.annotation is not _EMPTY else "any"
                     ),
                 }
+                for name, param in sig.parameters.items()
+                if name not in ("self", "_config")
+            ]
+
+            record = ToolFuncRecord(
+                id=func.__name__,
+                title=title,
+                description=desc,
+                parameters=args,
+                schema_factory=_schema_factory(schema),
+                fingerprint=fingerprint,
             )
+        else:
+            record.seeded = False
 
-        kwargs = {
-            "id": func.__name__,
-            "title": title,
-            "description": desc,
-            "parameters": {},
-            "returns": {"type": ",", "description": ""},
-            "schema": schema.model_json_schema() if schema else None,
-            "enabled": True,
-            "llm_tool": {},
-        }
-        tool_cls = func.__qualname__.split(".")[0]
-        # if tool_cls not in Toolkit.__tools:# temp fix tool_func run 1st , lastly run @tool -> regester issue
-        #     Toolkit.__tools[tool_cls] = kwargs 
-        Toolkit.register(func.__name__, kwargs, tool_cls=tool_cls)
+        # Registered with the class once its tool() decorator runs
+        pending = _PENDING_FUNCTIONS.setdefault((func.__module__, tool_cls), {})
+        if func.__name__ in pending:
+            raise ValueError(f"Tool {func.__name__} is already registered in {tool_cls}")
+        pending[func.__name__] = record
 
         @wraps(func)
         def wrapper(self: any, *args, **kwargs) -> any:
-            kwargs["_config"] = self.configuration.get("functions", {"config": ""}).get("config", {})
+            functions = self.configuration.get("functions") or _EMPTY_MAPPING
+            config = functions.get("config")
+            # A fresh dict when missing, so tools may write to their own _config
+            kwargs["_config"] = config if config is not None else {}
             return func(self, *args, **kwargs)
 
         return wrapper
@@ -0,0 +1,68 @@
+"""
+Generate app/tools/_registry_generated.py from the tools in app.tools.
+
+Run from the project root after adding or changing a tool:
+
+    python scripts/gen_registry.py
+
+Pass --check to only verify that the generated module is up to date (exit status 1
+if it is not), e.g. in CI.
+
+The generated REGISTRY seeds Toolkit when app.tools is imported, so the
+`tool`/`tool_func` decorators skip schema building and signature/docstring
+introspection for every tool it already describes. Each entry records a hash of
+its module's source file; a tool whose module was edited since generation is
+rebuilt from source instead. Models imported from other modules are not part of
+that hash, so keep the --check run in CI.
+"""
+
+import ast
+import importlib
+import pkgutil
+import pprint
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "app" / "tools" / "_registry_generated.py"
+HEADER = "# Generated by scripts/gen_registry.py -- do not edit by hand.\n\n"
+
+
+def build_registry(package: str = "app.tools") -> dict:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    # Block the current generated module so every tool is registered from source
+    sys.modules[f"{package}._registry_generated"] = None
+
+    tools = importlib.import_module(package)
+    for module in pkgutil.iter_modules(tools.__path__):
+        if not module.name.startswith("_"):
+            importlib.import_module(f"{package}.{module.name}")
+
+    from core.tools import Toolkit
+
+    return {name: record.to_dict() for name, record in Toolkit._tools.items()}
+
+
+def render(package: str = "app.tools") -> str:
+    registry = build_registry(package)
+    literal = pprint.pformat(registry, sort_dicts=True, width=100)
+    # Fail here rather than at import time if a default or schema is not a plain literal
+    ast.literal_eval(literal)
+    return f"{HEADER}REGISTRY = {literal}\n"
+
+
+def main(argv: list[str]) -> int:
+    source = render()
+    if "--check" in argv:
+        if not OUTPUT.exists() or OUTPUT.read_text() != source:
+            print(f"{OUTPUT.relative_to(ROOT)} is out of date; run python scripts/gen_registry.py")
+            return 1
+        return 0
+    OUTPUT.write_text(source)
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,16 @@
+from collections import ChainMap
+from types import MappingProxyType
+
+import pytest
+
+from core.tools import toolkit
+from core.tools.toolkit import Toolkit
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Give each test an empty, unfrozen registry."""
+    builtin = {}
+    monkeypatch.setattr(toolkit, "_BUILTIN_TOOLS", builtin)
+    monkeypatch.setattr(Toolkit, "_tools", ChainMap({}, MappingProxyType(builtin)))
+    return builtin
@@ -0,0 +1,31 @@
+import subprocess
+
+import pytest
+
+from app.utils import package
+from app.utils.package import install_package, install_packages
+
+
+@pytest.fixture
+def poetry(monkeypatch):
+    """Record `poetry add` runs instead of running them, starting from nothing installed."""
+    runs = []
+    monkeypatch.setattr(package, "_INSTALLED", set())
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: runs.append(args))
+    return runs
+
+
+def test_importable_package_skips_poetry(poetry):
+    assert install_package("json", module="json")
+    assert poetry == []
+
+
+def test_duplicates_are_added_in_one_run(poetry):
+    assert install_packages(["x", "x", "y"])
+    assert poetry == [["poetry", "add", "x", "y", "--group", "dev"]]
+
+
+def test_installed_packages_are_not_added_again(poetry):
+    install_package("x")
+    install_packages(["x", "y"])
+    assert poetry == [["poetry", "add", "x", "--group", "dev"], ["poetry", "add", "y", "--group", "dev"]]
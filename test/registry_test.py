@@ -0,0 +1,189 @@
+import ast
+import importlib.util
+import inspect
+import itertools
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from core.tools.toolkit import Toolkit, ToolFuncRecord, ToolRecord
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SOURCE = '''
+from pydantic import BaseModel, Field
+
+from core.tools.toolkit import Toolkit, tool, tool_func
+
+
+class Config(BaseModel):
+    api_key: str = Field(..., description="API key")
+
+
+@tool(Config, title="{title}", category="Search")
+class Sample(Toolkit):
+    @tool_func(Config, title="Search")
+    def search(self, query: str, _config: dict):
+        """
+        Search.
+
+        Args:
+            query (str): {query_doc}
+        """
+        return query
+'''
+
+_module_ids = itertools.count()
+
+
+@pytest.fixture
+def load_tool(tmp_path, monkeypatch):
+    """Import SOURCE as a fresh tool module file, the way app.tools modules are imported."""
+
+    def load(title: str = "Sample", query_doc: str = "The search query."):
+        name = f"sample_tool_{next(_module_ids)}"
+        path = tmp_path / f"{name}.py"
+        path.write_text(SOURCE.format(title=title, query_doc=query_doc))
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
+
+
+@pytest.fixture
+def seeded(registry, load_tool):
+    """Generate a registry entry from SOURCE, then start over with only that entry seeded."""
+
+    def seed(**source) -> ToolRecord:
+        load_tool(**source)
+        entry = Toolkit.tool("Sample").to_dict()
+        Toolkit._tools.maps[0].clear()
+        Toolkit.seed({"Sample": entry})
+        return Toolkit.tool("Sample")
+
+    return seed
+
+
+@pytest.fixture
+def spies(monkeypatch):
+    """Count JSON schema builds and signature introspection."""
+    calls = {"schema": 0, "signature": 0}
+    model_json_schema = BaseModel.model_json_schema.__func__
+    signature = inspect.signature
+
+    def schema_spy(cls, *args, **kwargs):
+        calls["schema"] += 1
+        return model_json_schema(cls, *args, **kwargs)
+
+    def signature_spy(*args, **kwargs):
+        calls["signature"] += 1
+        return signature(*args, **kwargs)
+
+    monkeypatch.setattr(BaseModel, "model_json_schema", classmethod(schema_spy))
+    monkeypatch.setattr(inspect, "signature", signature_spy)
+    return calls
+
+
+def test_generated_registry_is_up_to_date():
+    result = subprocess.run(
+        [sys.executable, "scripts/gen_registry.py", "--check"], cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_generator_emits_tool_functions(registry, tmp_path, monkeypatch):
+    package = tmp_path / "gen_sample_tools"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "sample.py").write_text(SOURCE.format(title="Sample", query_doc="The search query."))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    spec = importlib.util.spec_from_file_location("gen_registry", ROOT / "scripts" / "gen_registry.py")
+    gen_registry = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(gen_registry)
+
+    source = gen_registry.render("gen_sample_tools")
+    generated = ast.literal_eval(source.partition("REGISTRY = ")[2])
+
+    function = generated["Sample"]["functions"]["search"]
+    assert function["parameters"] == [
+        {"name": "query", "description": "The search query.", "optional": False, "default": None, "type": "string"}
+    ]
+    assert function["schema"]["title"] == "Config"
+
+
+def test_functions_register_before_class_decorator(registry, load_tool):
+    load_tool()
+    assert Toolkit.tool("Sample", "search").title == "Search"
+
+
+def test_unchanged_source_keeps_seeded_entries(seeded, load_tool):
+    record = seeded()
+    function = Toolkit.tool("Sample", "search")
+    load_tool()
+
+    assert Toolkit.tool("Sample") is record
+    assert Toolkit.tool("Sample", "search") is function
+
+
+def test_seeded_import_builds_no_schema_or_signature(seeded, load_tool, spies):
+    seeded()
+    spies.update(schema=0, signature=0)
+    load_tool()
+
+    assert spies == {"schema": 0, "signature": 0}
+
+
+def test_schema_is_built_on_first_access(registry, load_tool, spies):
+    load_tool()
+    assert spies["schema"] == 0
+
+    assert Toolkit.tool("Sample").schema["title"] == "Config"
+    assert spies["schema"] == 1
+
+
+def test_prune_drops_tools_missing_from_source(seeded):
+    seeded()
+    Toolkit.prune()
+    assert not Toolkit.is_registered("Sample")
+
+
+def test_prune_drops_functions_missing_from_source(seeded, load_tool):
+    seeded()
+    Toolkit.tool("Sample").functions["removed"] = ToolFuncRecord.from_dict({"id": "removed"})
+    load_tool()
+    Toolkit.prune()
+
+    assert Toolkit.is_registered("search", tool_cls="Sample")
+    assert not Toolkit.is_registered("removed", tool_cls="Sample")
+
+
+def test_prune_keeps_confirmed_entries(seeded, load_tool):
+    record = seeded()
+    load_tool()
+    Toolkit.prune()
+    assert Toolkit.tool("Sample") is record
+
+
+def test_changed_tool_is_rebuilt(seeded, load_tool):
+    record = seeded()
+    load_tool(title="Renamed")
+
+    rebuilt = Toolkit.tool("Sample")
+    assert rebuilt is not record and rebuilt.title == "Renamed"
+    assert "search" in rebuilt.functions
+
+
+def test_changed_function_is_rebuilt(seeded, load_tool):
+    seeded()
+    function = Toolkit.tool("Sample", "search")
+    load_tool(query_doc="What to look for.")
+
+    rebuilt = Toolkit.tool("Sample", "search")
+    assert rebuilt is not function
+    assert rebuilt.parameters[0]["description"] == "What to look for."
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from functools import partial
+
+import httpx
+import orjson
+import pytest
+import requests
+
+from app.tools.serpapi import SerpApiTool, _pick_results, _youtube_results
+
+
+class StubSession:
+    """Stands in for requests.Session, answering every GET with the same status and body."""
+
+    def __init__(self, status_code: int = 200, body: dict | None = None):
+        self.status_code = status_code
+        self.body = body if body is not None else {"video_results": [{"title": "video"}]}
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        response._content = orjson.dumps(self.body)
+        return response
+
+
+@pytest.fixture
+def serp():
+    tool = SerpApiTool({"api_key": "secret"})
+    tool._session = StubSession()
+    return tool
+
+
+# search cache
+
+
+def test_repeated_search_makes_one_request(serp):
+    first = serp.search_youtube("cats", {"num_results": 5})
+    second = serp.search_youtube("cats", {"num_results": 5})
+
+    assert first == second
+    assert json.loads(first)["video_results"] == [{"title": "video"}]
+    assert len(serp._session.calls) == 1
+
+
+def test_different_num_misses_cache(serp):
+    serp.search_youtube("cats", {"num_results": 5})
+    serp.search_youtube("cats", {"num_results": 10})
+
+    assert [call["num"] for call in serp._session.calls] == [5, 10]
+
+
+def test_client_error_is_returned_and_not_cached(serp):
+    serp._session.status_code = 429
+    result = serp.search_youtube("cats", {"num_results": 5})
+
+    assert "429" in result["error"]
+    assert "secret" not in result["error"]
+    assert len(serp._search_cache) == 0
+
+    serp._session.status_code = 200
+    serp.search_youtube("cats", {"num_results": 5})
+    assert len(serp._session.calls) == 2
+
+
+# async search
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Serve async searches from an httpx.MockTransport, recording each request."""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        engine = request.url.params["engine"]
+        key = "organic_results" if engine == "google" else "video_results"
+        return httpx.Response(200, json={key: [{"engine": engine}]})
+
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)))
+    return requests_seen
+
+
+def test_gathered_async_searches_share_cache_with_sync(serp, transport):
+    async def search_both():
+        async with serp:
+            return await asyncio.gather(
+                serp.search_google_async("cats", {}), serp.search_youtube_async("cats", {"num_results": 5})
+            )
+
+    google, youtube = asyncio.run(search_both())
+
+    assert json.loads(google)["search_results"] == [{"engine": "google"}]
+    assert json.loads(youtube)["video_results"] == [{"engine": "youtube"}]
+    assert len(transport) == 2
+
+    assert serp.search_youtube("cats", {"num_results": 5}) == youtube
+    assert serp._session.calls == []
+
+
+def test_async_client_follows_event_loop(serp, transport):
+    async def search():
+        await serp.search_google_async("cats", {})
+        return serp._aclient
+
+    first = asyncio.run(search())
+    serp._search_cache.clear()
+    second = asyncio.run(search())
+
+    assert first is not second
+    assert len(transport) == 2
+
+
+# install-and-retry
+
+
+def test_persistent_import_error_installs_once(serp, monkeypatch):
+    installs = []
+
+    def install_package(package, module=None):
+        installs.append(package)
+        return True
+
+    def missing_client():
+        raise ImportError("No module named 'requests'")
+
+    monkeypatch.setattr("app.tools.serpapi.install_package", install_package)
+    monkeypatch.setattr(serp, "_get_session", missing_client)
+
+    assert serp.search_youtube("cats", {"num_results": 5}) == {"error": "No module named 'requests'"}
+    assert installs == ["requests"]
+
+
+# _pick_results
+
+
+def test_pick_results_keeps_engine_fields():
+    body = orjson.dumps({"organic_results": [1], "search_metadata": {"id": "x"}, "video_results": [2]})
+    assert _pick_results("google", body) == {"organic_results": [1]}
+    assert _pick_results("youtube", body) == {"video_results": [2]}
+
+
+def test_pick_results_skips_missing_keys():
+    assert _pick_results("google", b'{"search_metadata": {}}') == {}
+    assert json.loads(_youtube_results({"video_results": [1]})) == {
+        "video_results": [1],
+        "movie_results": "",
+        "channel_results": "",
+    }
@@ -0,0 +1,105 @@
+import inspect
+
+import pytest
+
+from app.tools.serpapi import SerpApiTool
+from core.tools.toolkit import Toolkit, ToolFuncRecord, ToolRecord, _parse_args_block
+
+
+# _parse_args_block
+
+
+def test_parse_args_name_type_desc():
+    doc = "Summary.\n\nArgs:\n    query (str): The search query.\n    num (int): How many."
+    assert _parse_args_block(doc) == {"query": "The search query.", "num": "How many."}
+
+
+def test_parse_args_name_desc():
+    assert _parse_args_block("Args:\n    query: The search query.") == {"query": "The search query."}
+
+
+def test_parse_args_continuation_lines():
+    doc = "Args:\n    _config (dict): Configuration dictionary containing\n        the number of results."
+    assert _parse_args_block(doc) == {"_config": "Configuration dictionary containing the number of results."}
+
+
+def test_parse_args_name_then_type_layout():
+    descriptions = _parse_args_block(inspect.getdoc(SerpApiTool.search_youtube))
+    assert descriptions["query"] == "str The search query to use for fetching YouTube results."
+    assert descriptions["_config"].startswith("dict A configuration dictionary")
+
+
+def test_parse_args_stops_at_returns():
+    doc = "Args:\n    query (str): The query.\n\nReturns:\n    list: The results."
+    assert _parse_args_block(doc) == {"query": "The query."}
+
+
+def test_parse_args_without_args_section():
+    assert _parse_args_block("") == {}
+    assert _parse_args_block("Just a summary.\n\nReturns:\n    list: The results.") == {}
+
+
+# Toolkit.seed / freeze / register
+
+
+def test_register_function_requires_tool(registry):
+    with pytest.raises(ValueError, match="is not registered"):
+        Toolkit.register("f", ToolFuncRecord(id="f"), tool_cls="Missing")
+
+
+def test_register_function_twice(registry):
+    Toolkit.register("A", ToolRecord(id="A"))
+    Toolkit.register("f", ToolFuncRecord(id="f"), tool_cls="A")
+    with pytest.raises(ValueError, match="already registered"):
+        Toolkit.register("f", ToolFuncRecord(id="f"), tool_cls="A")
+
+
+def test_seed_builds_records_with_stored_schema(registry):
+    schema = {"title": "Cfg", "type": "object"}
+    Toolkit.seed(
+        {"A": {"id": "A", "title": "A", "schema": schema, "functions": {"f": {"id": "f", "fingerprint": "abc"}}}}
+    )
+
+    record = Toolkit.tool("A")
+    assert isinstance(record, ToolRecord) and record.seeded
+    assert record.schema == schema
+    assert Toolkit.tool("A", "f").fingerprint == "abc"
+    assert Toolkit.is_registered("f", tool_cls="A")
+
+
+def test_seed_keeps_existing_entries(registry):
+    existing = ToolRecord(id="A", title="source")
+    Toolkit.register("A", existing)
+    Toolkit.seed({"A": {"id": "A", "title": "generated"}})
+    assert Toolkit.tool("A") is existing
+
+
+def test_seed_round_trips_to_dict(registry):
+    record = ToolRecord(id="A", title="A", functions={"f": ToolFuncRecord(id="f", parameters=[{"name": "q"}])})
+    Toolkit.seed({"A": record.to_dict()})
+    assert Toolkit.tool("A").to_dict() == record.to_dict()
+
+
+def test_freeze_moves_tools_to_builtin_layer(registry):
+    Toolkit.register("A", ToolRecord(id="A"))
+    Toolkit.freeze()
+
+    assert "A" in registry
+    assert Toolkit._tools.maps[0] == {}
+    assert Toolkit.is_registered("A")
+    with pytest.raises(TypeError):
+        Toolkit._tools.maps[1]["B"] = ToolRecord(id="B")
+
+
+def test_frozen_tool_rejects_new_functions(registry):
+    Toolkit.register("A", ToolRecord(id="A"))
+    Toolkit.freeze()
+    with pytest.raises(ValueError, match="is frozen"):
+        Toolkit.register("f", ToolFuncRecord(id="f"), tool_cls="A")
+
+
+def test_register_after_freeze_goes_to_user_layer(registry):
+    Toolkit.freeze()
+    Toolkit.register("B", ToolRecord(id="B"))
+    Toolkit.register("f", ToolFuncRecord(id="f"), tool_cls="B")
+    assert "B" in Toolkit._tools.maps[0] and "B" not in registry